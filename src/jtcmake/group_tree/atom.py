@@ -7,6 +7,8 @@ from ..utils.nest import map_structure
 
 
 class IMemoAtom(metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def memo_value(self) -> object:
@@ -53,6 +55,8 @@ def unwrap_memo_values(nest: object) -> Tuple[object, _EvalLazyMemoValues]:
 
 
 class IAtom(IMemoAtom, metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def real_value(self) -> object:
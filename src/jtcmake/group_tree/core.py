@@ -36,6 +36,8 @@ from .event_logger import INoArgFunc, log_make_event
 
 
 class INode(metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def parent(self) -> IGroup:
@@ -210,6 +212,8 @@ class IGroup(INode, metaclass=ABCMeta):
 
 
 class IRule(INode, metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def raw_rule_id(self) -> int:
@@ -5,6 +5,8 @@ from typing import NoReturn
 
 
 class FakePath(Path):
+    __slots__ = ()
+
     def __new__(cls, *args: object, **kwargs: object):
         return object.__new__(cls)
 
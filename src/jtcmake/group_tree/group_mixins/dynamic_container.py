@@ -288,23 +288,12 @@ class DynamicRuleContainerMixin(IGroup, metaclass=ABCMeta):
         kwargs: Dict[str, object],
         noskip: bool,
     ) -> Rule[str]:
-        if name in self.rules:
-            raise KeyError(
-                f"A child rule with the same {name} already exists. "
-                "All child groups and rules must have unique names"
-            )
-
-        if name in self.groups:
-            raise KeyError(
-                f"A child group with the same {name} already exists. "
-                "All child groups and rules must have unique names"
-            )
-
+        # Name conflicts are checked by _add_rule_lazy before the factory runs
         def _factory() -> Rule[str]:
             r: Rule[str] = Rule.__new__(Rule)
 
             r.__init_at_once__(
-                (*self.name_tuple, name),
+                self.name_tuple + (name,),
                 self._get_info(),
                 self,
                 yfiles,
@@ -322,4 +311,9 @@ class DynamicRuleContainerMixin(IGroup, metaclass=ABCMeta):
     def _add_rule_lazy(
         self, name: str, rule_factory: Callable[[], Rule[str]]
     ) -> Rule[str]:
+        """
+        Register the rule created by ``rule_factory`` as a child named
+        ``name``. Must raise KeyError without calling ``rule_factory``
+        if a child group or rule named ``name`` already exists.
+        """
         ...
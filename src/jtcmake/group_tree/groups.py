@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import inspect
+from abc import ABCMeta
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
+    FrozenSet,
     Generic,
+    List,
     Mapping,
     Optional,
     Tuple,
     Type,
     TypeVar,
     Union,
-    get_origin,
     get_type_hints,
     overload,
 )
@@ -28,8 +31,51 @@ from .rule import Rule
 
 V = TypeVar("V")
 
+# Children of the kind a group never has (e.g. rules of GroupsGroup)
+_EMPTY_DICT_VIEW: Mapping[str, Any] = DictView({})
 
-class StaticGroupBase(BasicMixin, BasicInitMixin, SelectorMixin, MemoMixin):
+
+class _GroupNodeMixin(IGroup, metaclass=ABCMeta):
+    """
+    Node properties shared by the group classes. Subclasses must set the
+    fields in ``__init_as_child__`` .
+    """
+
+    __slots__ = ("_info", "_name", "_name_str", "_parent")
+
+    _info: GroupTreeInfo
+    _name: Tuple[str, ...]
+    _name_str: str
+    _parent: IGroup
+
+    # Names of the class-level attributes. Children whose name is in it must
+    # not be set as instance attributes so as not to shadow the methods and
+    # properties
+    _class_attr_names: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._class_attr_names = frozenset(dir(cls))
+
+    @property
+    def parent(self) -> IGroup:
+        return self._parent
+
+    @property
+    def name_tuple(self) -> Tuple[str, ...]:
+        return self._name
+
+    @property
+    def name(self) -> str:
+        return self._name_str
+
+    def _get_info(self) -> GroupTreeInfo:
+        return self._info
+
+
+class StaticGroupBase(
+    _GroupNodeMixin, BasicMixin, BasicInitMixin, SelectorMixin, MemoMixin
+):
     """
     Base class for static groups.
 
@@ -116,12 +162,25 @@ class StaticGroupBase(BasicMixin, BasicInitMixin, SelectorMixin, MemoMixin):
 
     """
 
+    __slots__ = ("_groups", "_groups_view", "_rules", "_rules_view")
+
     __globals__: Optional[Dict[str, object]] = None
-    _info: GroupTreeInfo
-    _name: Tuple[str, ...]
+    _child_plan: ClassVar[_ChildPlan]
     _groups: Dict[str, IGroup]
+    _groups_view: Mapping[str, IGroup]
     _rules: Dict[str, Rule[str]]
-    _parent: IGroup
+    _rules_view: Mapping[str, Rule[str]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Build the child plan in advance if the type hints are resolvable
+        # now. Otherwise (e.g. forward references to classes defined later),
+        # it is built at the first instantiation.
+        try:
+            cls._child_plan = _create_static_group_child_plan(cls)
+        except Exception:
+            pass
 
     def __init_as_child__(
         self,
@@ -132,67 +191,51 @@ class StaticGroupBase(BasicMixin, BasicInitMixin, SelectorMixin, MemoMixin):
         self._parent = parent
         self._info = info
         self._name = name
+        self._name_str = "/" + "/".join(name)
 
-        self._groups = {}
-        self._rules = {}
+        groups: Dict[str, IGroup] = {}
+        rules: Dict[str, Rule[str]] = {}
+        self._groups = groups
+        self._groups_view = DictView(groups)
+        self._rules = rules
+        self._rules_view = DictView(rules)
 
-        try:
-            if self.__globals__ is None:
-                hints = get_type_hints(type(self))
-            else:
-                hints = get_type_hints(type(self), None, self.__globals__)
-        except Exception as e:
-            raise Exception(
-                f"Failed to get type hints of static group class {type(self)}."
-            ) from e
-
-        for child_name, type_hint in hints.items():
-            fqcname = (*self._name, child_name)
-
-            tp = _get_type(type_hint)
-
-            if tp is None:
-                continue
-
-            if tp == Rule:
-                # Rule
-                r_: Any = Rule.__new__(Rule)
-                r: Rule[str] = r_
-                r.__init_partial__(fqcname, self._info, None, self)
-                setattr(self, child_name, r)
-                self._rules[child_name] = r
-            elif issubclass(tp, IGroup) and not inspect.isabstract(tp):
-                # Group
-                g = tp.__new__(tp)
-                g.__init_as_child__(self._info, self, fqcname)
-                setattr(self, child_name, g)
-                self._groups[child_name] = g
+        cls = type(self)
 
-    @property
-    def parent(self) -> IGroup:
-        return self._parent
+        # Read from the class's own __dict__ not to inherit the plan of the
+        # parent class
+        plan: Optional[_ChildPlan] = cls.__dict__.get("_child_plan")
+        if plan is None:
+            plan = cls._child_plan = _create_static_group_child_plan(cls)
+
+        for child_name, name_suffix, is_rule, factory in plan:
+            child = factory(info, self, name + name_suffix)
+            setattr(self, child_name, child)
+
+            if is_rule:
+                rules[child_name] = child
+            else:
+                groups[child_name] = child
 
     @property
     def groups(self) -> Mapping[str, IGroup]:
-        return DictView(self._groups)
+        return self._groups_view
 
     @property
     def rules(self) -> Mapping[str, Rule[str]]:
-        return DictView(self._rules)
-
-    @property
-    def name_tuple(self) -> Tuple[str, ...]:
-        return self._name
-
-    def _get_info(self) -> GroupTreeInfo:
-        return self._info
+        return self._rules_view
 
 
 T_Child = TypeVar("T_Child", bound=IGroup)
 
 
 class GroupsGroup(
-    BasicMixin, BasicInitMixin, SelectorMixin, MemoMixin, Generic[T_Child]
+    _GroupNodeMixin,
+    BasicMixin,
+    BasicInitMixin,
+    SelectorMixin,
+    MemoMixin,
+    Generic[T_Child],
 ):
     """
     A group that contains groups as children.
@@ -244,11 +287,11 @@ class GroupsGroup(
         import shutil; shutil.rmtree("out")  # Cleanup for Sphinx's doctest
     """
 
-    _name: Tuple[str, ...]
-    _parent: IGroup
-    _info: GroupTreeInfo
+    __slots__ = ("_groups", "_groups_view", "_child_group_type")
+
     _groups: Dict[str, T_Child]
-    _child_group_type: Union[None, Type[T_Child]] = None
+    _groups_view: Mapping[str, T_Child]
+    _child_group_type: Union[None, Type[T_Child]]
 
     def __init_as_child__(
         self,
@@ -259,7 +302,10 @@ class GroupsGroup(
         self._info = info
         self._parent = parent
         self._name = name
+        self._name_str = "/" + "/".join(name)
         self._groups = {}
+        self._groups_view = DictView(self._groups)
+        self._child_group_type = None
 
     def set_default_child(
         self, default_child_group_type: Type[T_Child]
@@ -305,16 +351,19 @@ class GroupsGroup(
                 ``self.set_default_child``), it will be used. Otherwise,
                 an exception will be raised.
         """
-        if not isinstance(
-            name, str
-        ):  # pyright: ignore [reportUnnecessaryIsInstance]
-            raise TypeError("name must be str")
+        if __debug__:
+            if not isinstance(
+                name, str
+            ):  # pyright: ignore [reportUnnecessaryIsInstance]
+                raise TypeError("name must be str")
 
         if name in self._groups:
             raise KeyError(f"Child group {name} already exists")
 
-        if child_group_type is None:
-            if self._child_group_type is None:
+        # The default type has been validated by set_default_child
+        default_tp = self._child_group_type
+        if child_group_type is None or child_group_type is default_tp:
+            if default_tp is None:
                 raise Exception(
                     "No child group type is available. "
                     "You must provide `child_group_type` or, in advance, "
@@ -323,47 +372,44 @@ class GroupsGroup(
                     "`GroupsGroup.set_props(some_group_type)`. "
                 )
 
-            tp: Type[T_Child] = self._child_group_type
+            tp: Type[T_Child] = default_tp
         else:
             tp = _parse_child_group_type(child_group_type)  # pyright: ignore
 
         g = tp.__new__(tp)
-        g.__init_as_child__(self._info, self, (*self._name, name))
+        g.__init_as_child__(self._info, self, self._name + (name,))
 
         self._groups[name] = g
 
-        if name.isidentifier() and name[0] != "_" and not hasattr(self, name):
+        if (
+            name.isidentifier()
+            and name[0] != "_"
+            and name not in self._class_attr_names
+        ):
             setattr(self, name, g)
 
         return g
 
-    @property
-    def parent(self) -> IGroup:
-        return self._parent
-
     @property
     def groups(self) -> Mapping[str, T_Child]:
-        return DictView(self._groups)
+        return self._groups_view
 
     @property
     def rules(self) -> Mapping[str, Rule[str]]:
-        return DictView({})
+        return _EMPTY_DICT_VIEW
 
     def __getitem__(self, k: str) -> T_Child:
         return self._groups[k]
 
     def __getattr__(self, k: str) -> T_Child:
-        return self[k]
-
-    @property
-    def name_tuple(self) -> Tuple[str, ...]:
-        return self._name
-
-    def _get_info(self) -> GroupTreeInfo:
-        return self._info
+        try:
+            return self._groups[k]
+        except KeyError:
+            raise AttributeError(f"No child group named {k}") from None
 
 
 class RulesGroup(
+    _GroupNodeMixin,
     DynamicRuleContainerMixin,
     BasicMixin,
     BasicInitMixin,
@@ -392,10 +438,10 @@ class RulesGroup(
         import shutil; shutil.rmtree("out")  # Cleanup for Sphinx's doctest
     """
 
-    _name: Tuple[str, ...]
-    _parent: IGroup
-    _info: GroupTreeInfo
+    __slots__ = ("_rules", "_rules_view")
+
     _rules: Dict[str, Rule[str]]
+    _rules_view: Mapping[str, Rule[str]]
 
     def __init_as_child__(
         self, info: GroupTreeInfo, parent: IGroup, name: Tuple[str, ...]
@@ -403,7 +449,9 @@ class RulesGroup(
         self._info = info
         self._parent = parent
         self._name = name
+        self._name_str = "/" + "/".join(name)
         self._rules = {}
+        self._rules_view = DictView(self._rules)
 
     def _add_rule_lazy(
         self, name: str, rule_factory: Callable[[], Rule[str]]
@@ -415,38 +463,31 @@ class RulesGroup(
 
         self._rules[name] = r
 
-        if name.isidentifier() and not hasattr(self, name):
+        if name.isidentifier() and name not in self._class_attr_names:
             setattr(self, name, r)
 
         return r
 
-    @property
-    def parent(self) -> IGroup:
-        return self._parent
-
     @property
     def groups(self) -> Mapping[str, IGroup]:
-        return DictView({})
+        return _EMPTY_DICT_VIEW
 
     @property
     def rules(self) -> Mapping[str, Rule[str]]:
-        return DictView(self._rules)
+        return self._rules_view
 
     def __getitem__(self, k: str) -> Rule[str]:
         return self._rules[k]
 
     def __getattr__(self, k: str) -> Rule[str]:
-        return self[k]
-
-    @property
-    def name_tuple(self) -> Tuple[str, ...]:
-        return self._name
-
-    def _get_info(self) -> GroupTreeInfo:
-        return self._info
+        try:
+            return self._rules[k]
+        except KeyError:
+            raise AttributeError(f"No child rule named {k}") from None
 
 
 class UntypedGroup(
+    _GroupNodeMixin,
     BasicMixin,
     DynamicRuleContainerMixin,
     BasicInitMixin,
@@ -501,11 +542,12 @@ class UntypedGroup(
         import shutil; shutil.rmtree("out")  # Cleanup for Sphinx's doctest
     """
 
-    _name: Tuple[str, ...]
-    _parent: IGroup
-    _info: GroupTreeInfo
+    __slots__ = ("_groups", "_groups_view", "_rules", "_rules_view")
+
     _groups: Dict[str, IGroup]
+    _groups_view: Mapping[str, IGroup]
     _rules: Dict[str, Rule[str]]
+    _rules_view: Mapping[str, Rule[str]]
 
     def __init_as_child__(
         self, info: GroupTreeInfo, parent: IGroup, name: Tuple[str, ...]
@@ -513,20 +555,32 @@ class UntypedGroup(
         self._info = info
         self._parent = parent
         self._name = name
+        self._name_str = "/" + "/".join(name)
         self._groups = {}
+        self._groups_view = DictView(self._groups)
         self._rules = {}
+        self._rules_view = DictView(self._rules)
 
     def _add_rule_lazy(
         self, name: str, rule_factory: Callable[[], Rule[str]]
     ) -> Rule[str]:
         if name in self._rules:
-            raise KeyError(f"Rule {name} already exists in the group")
+            raise KeyError(
+                f"A child rule with the same {name} already exists. "
+                "All child groups and rules must have unique names"
+            )
+
+        if name in self._groups:
+            raise KeyError(
+                f"A child group with the same {name} already exists. "
+                "All child groups and rules must have unique names"
+            )
 
         r = rule_factory()
 
         self._rules[name] = r
 
-        if name.isidentifier() and not hasattr(self, name):
+        if name.isidentifier() and name not in self._class_attr_names:
             setattr(self, name, r)
 
         return r
@@ -539,7 +593,7 @@ class UntypedGroup(
     def add_group(self, name: str) -> UntypedGroup:
         ...
 
-    def add_group(self, name: object, child_group_type: Any = None) -> IGroup:
+    def add_group(self, name: str, child_group_type: Any = None) -> IGroup:
         """
         Append a child group to this group.
 
@@ -553,10 +607,11 @@ class UntypedGroup(
         else:
             tp = _parse_child_group_type(child_group_type)
 
-        if not isinstance(
-            name, str
-        ):  # pyright: ignore [reportUnnecessaryIsInstance]
-            raise TypeError("name must be str")
+        if __debug__:
+            if not isinstance(
+                name, str
+            ):  # pyright: ignore [reportUnnecessaryIsInstance]
+                raise TypeError("name must be str")
 
         if name in self._groups:
             raise KeyError(
@@ -571,48 +626,139 @@ class UntypedGroup(
             )
 
         g = tp.__new__(tp)
-        g.__init_as_child__(self._info, self, (*self._name, name))
+        g.__init_as_child__(self._info, self, self._name + (name,))
 
         self._groups[name] = g
 
-        if name.isidentifier() and name[0] != "_" and not hasattr(self, name):
+        if (
+            name.isidentifier()
+            and name[0] != "_"
+            and name not in self._class_attr_names
+        ):
             setattr(self, name, g)
 
         return g
 
-    @property
-    def parent(self) -> IGroup:
-        return self._parent
-
     @property
     def groups(self) -> Mapping[str, IGroup]:
-        return DictView(self._groups)
+        return self._groups_view
 
     @property
     def rules(self) -> Mapping[str, Rule[str]]:
-        return DictView(self._rules)
-
-    def _get_info(self) -> GroupTreeInfo:
-        return self._info
-
-    @property
-    def name_tuple(self) -> Tuple[str, ...]:
-        return self._name
+        return self._rules_view
 
     def __getitem__(self, k: str) -> Any:
-        if k in self.groups:
-            return self.groups[k]
+        g = self._groups.get(k)
 
+        if g is not None:
+            return g
         else:
-            return self.rules[k]
+            return self._rules[k]
 
     def __getattr__(self, __name: str) -> Any:
-        if __name in self.groups:
-            return self.groups[__name]
-        elif __name in self.rules:
-            return self.rules[__name]
+        g = self._groups.get(__name)
+
+        if g is not None:
+            return g
+
+        r = self._rules.get(__name)
+
+        if r is not None:
+            return r
+        else:
+            raise AttributeError(f"No child group or rule named {__name}")
+
+
+_ChildFactory = Callable[[GroupTreeInfo, IGroup, Tuple[str, ...]], Any]
+_ChildPlan = Tuple[Tuple[str, Tuple[str], bool, _ChildFactory], ...]
+
+
+def _create_static_group_child_plan(cls: Type[StaticGroupBase]) -> _ChildPlan:
+    """
+    Child nodes declared by the type hints of a static group class as
+    (name, (name,), is_rule, factory) entries, where
+    ``factory(info, parent, name_tuple)`` creates the child node.
+    The 1-tuple of the name is there to be appended to the parent's name
+    tuple without building it on every instantiation.
+    Annotations of neither rules nor groups are omitted.
+
+    Annotations of a class do not change after its definition, so the plan
+    is stored as ``cls._child_plan`` and computed only once per class:
+    at the class definition if possible, or at its first instantiation if
+    the type hints contain forward references that are not resolvable at
+    the class definition.
+    """
+    try:
+        if cls.__globals__ is None:
+            hints = get_type_hints(cls)
         else:
-            raise KeyError(f"No child group or rule named {__name}")
+            hints = get_type_hints(cls, None, cls.__globals__)
+    except Exception as e:
+        raise Exception(
+            f"Failed to get type hints of static group class {cls}."
+        ) from e
+
+    plan: List[Tuple[str, Tuple[str], bool, _ChildFactory]] = []
+
+    for name, type_hint in hints.items():
+        kind, tp = _classify_child_type_hint(type_hint)
+
+        if kind == _CHILD_RULE:
+            plan.append((name, (name,), True, _create_rule_child))
+        elif kind == _CHILD_GROUP:
+            assert tp is not None
+            plan.append((name, (name,), False, _group_child_factory(tp)))
+
+    return tuple(plan)
+
+
+def _create_rule_child(
+    info: GroupTreeInfo, parent: IGroup, name: Tuple[str, ...]
+) -> Rule[str]:
+    # Same as Rule.__new__(Rule) without the indirection of FakePath.__new__
+    r_: Any = object.__new__(Rule)
+    r: Rule[str] = r_
+    r.__init_partial__(name, info, None, parent)
+    return r
+
+
+def _group_child_factory(tp: Type[IGroup]) -> _ChildFactory:
+    new = tp.__new__
+
+    def _create_group_child(
+        info: GroupTreeInfo, parent: IGroup, name: Tuple[str, ...]
+    ) -> IGroup:
+        g = new(tp)
+        g.__init_as_child__(info, parent, name)
+        return g
+
+    return _create_group_child
+
+
+# Kinds of the child nodes declared by type hints of static groups
+_CHILD_NONE = 0
+_CHILD_RULE = 1
+_CHILD_GROUP = 2
+
+
+def _classify_child_type_hint(
+    type_hint: object,
+) -> Tuple[int, Optional[Type[IGroup]]]:
+    """
+    Classify a (fully resolved) type hint of a static group's attribute into
+    one of _CHILD_NONE, _CHILD_RULE, and _CHILD_GROUP.
+    For _CHILD_GROUP, the concrete group class is returned together.
+    """
+    tp = _get_type(type_hint)
+
+    if tp is None:
+        return _CHILD_NONE, None
+    elif tp == Rule:
+        return _CHILD_RULE, None
+    elif issubclass(tp, IGroup) and not inspect.isabstract(tp):
+        return _CHILD_GROUP, tp
+    else:
+        return _CHILD_NONE, None
 
 
 def _get_type(type_hint: object) -> Union[None, Type[Any]]:
@@ -623,7 +769,9 @@ def _get_type(type_hint: object) -> Union[None, Type[Any]]:
     if isinstance(type_hint, type):
         return type_hint
 
-    origin = get_origin(type_hint)
+    # Generic alias (e.g. Rule[str]). Reading __origin__ directly is much
+    # cheaper than typing.get_origin, which dispatches on the alias kinds
+    origin = getattr(type_hint, "__origin__", None)
 
     if isinstance(origin, type):
         return origin
@@ -632,15 +780,19 @@ def _get_type(type_hint: object) -> Union[None, Type[Any]]:
 
 
 def _parse_child_group_type(child_group_type: object) -> Type[IGroup]:
+    # Valid ones are exactly those classified as _CHILD_GROUP
+    kind, tp = _classify_child_type_hint(child_group_type)
+
+    if kind == _CHILD_GROUP:
+        assert tp is not None
+        return tp
+
     tp = _get_type(child_group_type)
 
     if tp is None:
-        raise TypeError(f"{tp} is not a valid type")
+        raise TypeError(f"{child_group_type} is not a valid type")
 
     if not issubclass(tp, IGroup):
         raise TypeError("Child group type must be a subclass of IGroup")
 
-    if inspect.isabstract(tp):
-        raise TypeError("Child group type must not be abstract")
-
-    return tp
+    raise TypeError("Child group type must not be abstract")
@@ -3,18 +3,21 @@ from __future__ import annotations
 import inspect
 import os
 import re
+import sys
 import time
+import types
+import weakref
 from os import PathLike
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     Collection,
-    Container,
     Dict,
     Generic,
     List,
     Mapping,
+    NoReturn,
     Optional,
     Sequence,
     Tuple,
@@ -23,15 +26,14 @@ from typing import (
     overload,
 )
 
-from typing_extensions import Concatenate, ParamSpec, TypeGuard
+from typing_extensions import ParamSpec, TypeGuard
 
 from ..core.make import MakeSummary
 from ..memo import Memo
 from ..raw_rule import IMemo
 from ..utils.dict_view import DictView
-from ..utils.nest import map_structure
 from ..utils.strpath import StrOrPath
-from .atom import unwrap_real_values
+from .atom import Atom
 from .core import (
     GroupTreeInfo,
     IAtom,
@@ -48,7 +50,6 @@ from .file import File, VFile
 
 K = TypeVar("K", bound=str)
 P = ParamSpec("P")
-T = TypeVar("T")
 
 
 class _NoArgFunc(INoArgFunc):
@@ -103,44 +104,44 @@ class SelfRule:
 
 SELF: Any = SelfRule()
 
-_T_Rule = TypeVar("_T_Rule", bound=IRule)
 _T_deco_f = TypeVar("_T_deco_f", bound=Callable[[], object])
 
 
-def require_init(
-    rule_method: Callable[Concatenate[_T_Rule, P], T]
-) -> Callable[Concatenate[_T_Rule, P], T]:
-    def _method(self: _T_Rule, *args: P.args, **kwargs: P.kwargs) -> T:
-        info = self._get_info()  # pyright: ignore [reportPrivateUsage]
-
-        if self.name_tuple in info.rules_to_be_init:
-            try:
-                method_name = rule_method.__name__
-            except AttributeError:
-                method_name = "<unknown method>"
-
-            raise Exception(
-                f"Rule {self.name} must be initialized "
-                f"before calling the method ({method_name})"
-            )
-
-        return rule_method(self, *args, **kwargs)
-
-    return _method
+def _raise_uninitialized(rule: Rule[Any], method_name: str) -> NoReturn:
+    # Called by the members of Rule that require it to be initialized,
+    # after they check rule._initialized inline
+    raise Exception(
+        f"Rule {rule.name} must be initialized "
+        f"before calling the method ({method_name})"
+    )
 
 
 class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
     IRule, IAtom, FakePath, Generic[K]
 ):
+    __slots__ = (
+        "_raw_rule_id",
+        "_info",
+        "_name",
+        "_files",
+        "_xfiles",
+        "_file_keys_hint",
+        "_files_values",
+        "_parent",
+        "_memo",
+        "_initialized",
+    )
+
     _raw_rule_id: int
     _info: GroupTreeInfo
     _name: Tuple[str]
     _files: DictView[K, IFile]
     _xfiles: Sequence[str]
     _file_keys_hint: Optional[List[K]]
-    _file_keys: List[K]
+    _files_values: Tuple[IFile, ...]
     _parent: IGroup
     _memo: Memo[object] | None
+    _initialized: bool
 
     def __init_partial__(
         self,
@@ -153,7 +154,7 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
         self._name = name
         self._file_keys_hint = file_keys_hint
         self._parent = parent
-        self._file_keys = []  # do not read before the rule is fully initialized
+        self._initialized = False
 
         self._info.rules_to_be_init.add(name)
 
@@ -170,6 +171,7 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
 
         self._init_main(yfiles, method, args, kwargs, noskip)
         self._info.rules_to_be_init.remove(self._name)
+        self._initialized = True
 
     def __init_at_once__(
         self,
@@ -186,22 +188,33 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
         self._name = name
         self._file_keys_hint = None
         self._parent = parent
-        self._file_keys = []  # do not read before the rule is fully initialized
+        self._initialized = False
         self._init_main(yfiles, method, args, kwargs, noskip)
+        self._initialized = True
 
         return self
 
     @property
     def initialized(self) -> bool:
-        return self._name not in self._info.rules_to_be_init
+        return self._initialized
 
     def __getattr__(self, key: K) -> IFile:
-        """Just for type checkers"""
-        raise AttributeError(key)
+        # Called only if the normal lookup fails. So the output files
+        # never shadow the other attributes
+        try:
+            # Bypass __getattr__ as _files is unset before initialization
+            files = object.__getattribute__(self, "_files")
+        except AttributeError:
+            raise AttributeError(key) from None
+
+        if key not in files:
+            raise AttributeError(key)
+
+        return files[key]
 
     def __getitem__(self, key: Union[int, K]) -> IFile:
         if isinstance(key, int):
-            return self._files[self._file_keys[key]]
+            return self._files_values[key]
         else:
             return self._files[key]
 
@@ -239,13 +252,16 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
 
         if file:
             for f in self.files.values():
-                if not f.exists():
+                # Try utime first. It is the only syscall for existing files
+                try:
+                    os.utime(f, (t, t))
+                except (FileNotFoundError, NotADirectoryError):
                     if not create:
                         continue
 
                     f.touch()
+                    os.utime(f, (t, t))
 
-                os.utime(f, (t, t))
                 logwriter.info(f"touch {f}")
 
         if memo:
@@ -281,29 +297,27 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
 
         args_ = (args, kwargs)
 
-        # Add path prefix
-        yfiles = {
-            k: type(f)(_normalize_path(str(f), self._parent.prefix))
-            for k, f in yfiles.items()
-        }
-
-        # (Abspath of output) => (IFile of output)
-        yp2f = {os.path.abspath(f): f for f in yfiles.values()}
-
-        # Replace reserved objects by Atoms
-        args_ = _replace_obj_by_atom_in_structure(self._info.memo_store, args_)
+        cwd = os.getcwd()
 
-        # Replace SELFs
-        args_ = _replace_self({k: v for k, v in yfiles.items()}, args_)
+        # Add path prefix. And map (Abspath of output) => (IFile of output)
+        prefix = self._parent.prefix
+        yfiles_: Dict[K, IFile] = {}
+        yp2f: Dict[str, IFile] = {}
+        for k, f in yfiles.items():
+            f = type(f)(_normalize_path(str(f), prefix, cwd))
+            yfiles_[k] = f
+            yp2f[_abspath(f, cwd)] = f
 
-        # Assert that all outputs are included in the arguments
-        _assert_all_yfiles_used_in_args(yp2f, args_)
+        yfiles = yfiles_
 
-        # (Abspath of input) => (IFile of input)
-        xp2f = _find_xfiles_in_args(yp2f, args_)
+        # Replace reserved objects by Atoms and SELFs by the output files,
+        # and find the input files ((Abspath of input) => (IFile of input))
+        args_, real_args, xp2f = _resolve_args(
+            self._info.memo_store, yfiles, yp2f, args_, cwd
+        )
 
         # Create final method arguments
-        method_args, method_kwargs = unwrap_real_values(args_)  # type: ignore
+        method_args, method_kwargs = real_args  # type: ignore
 
         # Validate method signature
         if not callable(method):
@@ -327,15 +341,11 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
         self._raw_rule_id = raw_rule.id
         self._files = DictView(yfiles)
         self._xfiles = list(xp2f)
-        self._file_keys = list(yfiles)
+        self._files_values = tuple(yfiles.values())
 
         if isinstance(memo, Memo):
             self._memo = memo
 
-        for k, f in yfiles.items():
-            if k.isidentifier() and not hasattr(self, k):
-                setattr(self, k, f)
-
     @overload
     def init(
         self,
@@ -626,8 +636,10 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
         return self._info
 
     @property
-    @require_init
     def raw_rule_id(self) -> int:
+        if not self._initialized:
+            _raise_uninitialized(self, "raw_rule_id")
+
         return self._raw_rule_id
 
     @require_tree_init
@@ -670,13 +682,17 @@ class Rule(  # pyright: ignore [reportIncompatibleMethodOverride]
         return self._name
 
     @property
-    @require_init
     def files(self) -> Mapping[K, IFile]:
+        if not self._initialized:
+            _raise_uninitialized(self, "files")
+
         return self._files
 
     @property
-    @require_init
     def xfiles(self) -> Collection[str]:
+        if not self._initialized:
+            _raise_uninitialized(self, "xfiles")
+
         return self._xfiles
 
     @property
@@ -709,8 +725,7 @@ def Rule_init_parse_deco_func(
     if not callable(method):
         raise TypeError(f"method must be callable. Given {method}")
 
-    sig = inspect.signature(method)
-    params = sig.parameters
+    params = _get_signature(method).parameters
 
     nodefaults = [
         name
@@ -754,18 +769,27 @@ def _validate_type(tp: Tuple[type[T_type], ...], o: object, msg: str) -> T_type:
 
 
 def _pathlike_to_str(p: object) -> str:
+    if type(p) is str:
+        return p
+
     if not isinstance(p, (str, os.PathLike)):
-        raise TypeError("Expected str or os.PathLike. Got {p}")
+        raise TypeError(f"Expected str or os.PathLike. Got {p}")
 
-    return _validate_str(os.fspath(p), "bytes path is not allowed. ({p})")
+    return _validate_str(os.fspath(p), f"bytes path is not allowed. ({p})")
 
 
-def _to_IFile(f: object, IFile_factory: Callable[[StrOrPath], IFile]) -> IFile:
+def _create_IFile(
+    f: object, path: str, IFile_factory: Callable[[StrOrPath], IFile]
+) -> IFile:
+    """
+    Create an IFile of ``path``. Its class is the same as ``f`` if ``f`` is
+    an IFile, otherwise the one ``IFile_factory`` creates.
+    """
     if isinstance(f, IFile):
-        return f
+        return type(f)(path)
 
     if isinstance(f, (str, os.PathLike)):
-        return IFile_factory(f)
+        return IFile_factory(path)
 
     raise TypeError(f"Output file must be str or PathLike. Given {f}")
 
@@ -776,38 +800,27 @@ def parse_args_output_files(
     output_files: object,
     IFile_factory: Callable[[StrOrPath], IFile],
 ) -> Dict[K, IFile]:
+    outs: Dict[str, IFile] = {}
+
     if isinstance(output_files, (tuple, list)):
-        output_files_str = map(_pathlike_to_str, output_files)
-        output_files_str = (
-            _repl_name_ref(p, rule_name, None) for p in output_files_str
-        )
-        outs: Dict[str, IFile] = {
-            v: type(_to_IFile(f, IFile_factory))(v)
-            for v, f in zip(  # pyright: ignore [reportUnknownVariableType]
-                output_files_str, output_files
-            )
-        }
+        for f in output_files:  # pyright: ignore [reportUnknownVariableType]
+            k = _repl_name_ref(_pathlike_to_str(f), rule_name, None)
+            outs[k] = _create_IFile(f, k, IFile_factory)
     elif isinstance(output_files, (str, os.PathLike)):
         k = _pathlike_to_str(output_files)
         k = _repl_name_ref(k, rule_name, None)
-        outs = {k: type(_to_IFile(output_files, IFile_factory))(k)}
+        outs[k] = _create_IFile(output_files, k, IFile_factory)
     elif isinstance(output_files, Mapping):
         output_files_: Mapping[object, object] = output_files
-        keys = [
-            _validate_type((str,), k, "file key must be str")
-            for k in output_files_
-        ]
-        files_str = map(_pathlike_to_str, output_files_.values())
-        files_str = (
-            _repl_name_ref(f, rule_name, k) for k, f in zip(keys, files_str)
-        )
 
-        files = (
-            type(_to_IFile(f, IFile_factory))(sf)
-            for f, sf in zip(output_files_.values(), files_str)
-        )
+        if not all(type(k) is str for k in output_files_):
+            for k in output_files_:
+                _validate_type((str,), k, "file key must be str")
 
-        outs = {k: _to_IFile(f, IFile_factory) for k, f in zip(keys, files)}
+        files: Mapping[str, object] = output_files_  # pyright: ignore
+        for k, f in files.items():
+            p = _repl_name_ref(_pathlike_to_str(f), rule_name, k)
+            outs[k] = _create_IFile(f, p, IFile_factory)
     else:
         raise TypeError(
             "output_files must be str | PathLike | Sequence[str|PathLike] "
@@ -829,78 +842,204 @@ def _check_file_keys(
     if ref is None:
         return True
 
-    return len(files) == len(ref) and all(a == b for a, b in zip(files, ref))
+    keys = list(files)
+    return keys == (ref if type(ref) is list else list(ref))
 
 
-def _normalize_path(p: str, pfx: str) -> str:
+def _normalize_path(p: str, pfx: str, cwd: str) -> str:
     p = concat_prefix(p, pfx)
 
+    if not os.path.isabs(p) and ".." not in p and ":" not in p:
+        # relpath(p, cwd) equals normpath(p) for such paths
+        normed = os.path.normpath(p)
+        return normed if len(normed) < len(p) else p
+
     try:
-        rel = os.path.relpath(p, os.getcwd())
+        rel = os.path.relpath(p, cwd)
         return rel if len(rel) < len(p) else p
     except Exception:
         return p
 
 
-def _replace_obj_by_atom_in_structure(
-    memo_store: Mapping[int, IAtom], args: object
-) -> object:
-    def _rec(o: object) -> object:
-        if id(o) in memo_store:
-            return memo_store[id(o)]
-        elif isinstance(o, dict):
-            _o: Dict[object, object] = o
-            return {k: _rec(v) for k, v in _o.items()}
-        elif isinstance(o, tuple):
-            return tuple(map(_rec, o))
-        elif isinstance(o, list):
-            return list(map(_rec, o))
-        elif isinstance(o, set):
-            return set(map(_rec, o))
-        else:
-            return o
-
-    return _rec(args)
-
-
-def _replace_self(files: Mapping[str, IFile], args: object) -> object:
-    def repl(o: object):
-        if isinstance(o, SelfRule):
-            if o.key is None:
-                if len(files) >= 2:
-                    raise TypeError(
-                        "Self-without-key is not allowed when the "
-                        "rule has multiple output files"
-                    )
-
-                return next(iter(files.values()))
-            elif isinstance(o.key, int):
-                if o.key >= len(files):
-                    raise IndexError(
-                        f"SELF index is {o.key} but the rule "
-                        f"has only {len(files)} output files"
-                    )
-                return list(files.values())[o.key]
-            else:
-                if o.key not in files:
-                    raise KeyError(f"Failed to resolve SELF: {o.key}")
-                return files[o.key]
-        else:
-            return o
-
-    return map_structure(repl, args)
-
-
-def _assert_all_yfiles_used_in_args(ypaths: Collection[str], args: object):
+# Types whose instances never contain objects to be replaced
+_ATOMIC_TYPES = frozenset((str, bytes, int, float, bool, type(None)))
+
+
+if sys.platform == "win32":
+
+    def _abspath(p: StrOrPath, cwd: str) -> str:
+        return os.path.abspath(p)
+
+else:
+
+    def _abspath(p: StrOrPath, cwd: str) -> str:
+        # Same as os.path.abspath(p) if cwd is the current directory.
+        # Saves a getcwd call per path
+        return os.path.normpath(os.path.join(cwd, p))
+
+
+# Kinds of the nodes of method arguments (see _resolve_args)
+_ARG_OTHER = 0
+_ARG_DICT = 1
+_ARG_TUPLE = 2
+_ARG_LIST = 3
+_ARG_SET = 4
+_ARG_SELF = 5
+_ARG_FILE = 6
+_ARG_RULE = 7
+_ARG_ATOM = 8
+
+
+def _classify_arg_type(tp: type) -> int:
+    if issubclass(tp, dict):
+        return _ARG_DICT
+    elif issubclass(tp, tuple):
+        return _ARG_TUPLE
+    elif issubclass(tp, list):
+        return _ARG_LIST
+    elif issubclass(tp, set):
+        return _ARG_SET
+    elif issubclass(tp, SelfRule):
+        return _ARG_SELF
+    elif issubclass(tp, IFile):
+        return _ARG_FILE
+    elif issubclass(tp, IRule):
+        return _ARG_RULE
+    elif issubclass(tp, IAtom):
+        return _ARG_ATOM
+    else:
+        return _ARG_OTHER
+
+
+# Kinds of types. Saves the isinstance checks (most of which go through
+# ABCMeta) for every node of method arguments.
+# Common types which live as long as the program are looked up in a plain
+# dict. The others (e.g. user classes) are cached weakly not to keep them
+# alive, which costs a bit more per lookup
+_arg_kinds: Dict[type, int] = {
+    tp: _classify_arg_type(tp)
+    for tp in (
+        *_ATOMIC_TYPES,
+        dict,
+        tuple,
+        list,
+        set,
+        type(Path()),
+        SelfRule,
+        File,
+        VFile,
+        Atom,
+        Rule,
+    )
+}
+_arg_kinds_weak: weakref.WeakKeyDictionary[
+    type, int
+] = weakref.WeakKeyDictionary()
+
+
+def _get_uncommon_arg_kind(tp: type) -> int:
+    # For the types not in _arg_kinds
+    kind = _arg_kinds_weak.get(tp)
+
+    if kind is None:
+        kind = _arg_kinds_weak[tp] = _classify_arg_type(tp)
+
+    return kind
+
+
+def _resolve_args(
+    memo_store: Mapping[int, IAtom],
+    files: Mapping[str, IFile],
+    ypaths: Mapping[str, IFile],
+    args: object,
+    cwd: str,
+) -> Tuple[object, object, Dict[str, IFile]]:
+    """
+    Traverse ``args`` once to
+
+    * replace the objects registered in ``memo_store`` by their Atoms
+    * replace SELFs by the output files
+    * find the input files
+    * assert that all the output files appear in ``args``
+
+    Args:
+        ypaths: maps the abspath of each output file to its IFile
+
+    Returns:
+        tuple (args with the replacements, their real values, xp2f) where
+        xp2f maps the abspath of each input file to its IFile
+    """
     unused = set(ypaths)
-
-    def check(v: object):
-        if isinstance(v, IFile):
-            absp = os.path.abspath((v))
+    xp2f: Dict[str, IFile] = {}
+    file_list = list(files.values())
+
+    # id(IFile) => abspath, seeded with the output files. The IFiles stay
+    # alive during the traversal so their ids are not reused
+    abspaths = {id(f): p for p, f in ypaths.items()}
+
+    def _rec(o: object) -> Tuple[object, object]:
+        atom = memo_store.get(id(o))
+
+        if atom is not None:
+            o = atom
+
+        kind = _arg_kinds.get(type(o))
+        if kind is None:
+            kind = _get_uncommon_arg_kind(type(o))
+
+        if kind == _ARG_OTHER:
+            return o, o
+        elif kind == _ARG_DICT:
+            _o: Dict[object, object] = o  # pyright: ignore
+            res: Dict[object, object] = {}
+            real: Dict[object, object] = {}
+            for k, v in _o.items():
+                res[k], real[k] = _rec(v)
+            return res, real
+        elif kind <= _ARG_SET:
+            _seq: Collection[object] = o  # pyright: ignore
+            res_seq: List[object] = []
+            real_seq: List[object] = []
+            for v in _seq:
+                a, r = _rec(v)
+                res_seq.append(a)
+                real_seq.append(r)
+
+            if kind == _ARG_TUPLE:
+                return tuple(res_seq), tuple(real_seq)
+            elif kind == _ARG_LIST:
+                return res_seq, real_seq
+            else:
+                return set(res_seq), set(real_seq)
+        elif kind == _ARG_ATOM:
+            return o, o.real_value  # pyright: ignore
+
+        if kind == _ARG_SELF:
+            o = _resolve_self(files, file_list, o)  # pyright: ignore
+            kind = _ARG_FILE
+
+        if kind == _ARG_FILE:
+            absp = abspaths.get(id(o))
+            if absp is None:
+                absp = abspaths[id(o)] = _abspath(o, cwd)  # pyright: ignore
             if absp in unused:
                 unused.remove(absp)
+            elif absp not in ypaths:
+                xp2f[absp] = o  # pyright: ignore
+            return o, o.real_value  # pyright: ignore
+        else:
+            assert kind == _ARG_RULE
+            f = next(iter(o.files.values()))  # pyright: ignore
+            absp = _abspath(f, cwd)
+            if absp not in ypaths:
+                xp2f[absp] = f
 
-    map_structure(check, args)
+            if isinstance(o, IAtom):
+                return o, o.real_value
+            else:
+                return o, o
+
+    res, real = _rec(args)
 
     if len(unused) > 0:
         raise ValueError(
@@ -908,28 +1047,98 @@ def _assert_all_yfiles_used_in_args(ypaths: Collection[str], args: object):
             f"Unused ones are: {unused}"
         )
 
+    return res, real, xp2f
 
-def _find_xfiles_in_args(
-    ypaths: Container[str], args: object
-) -> Dict[str, IFile]:
-    res: Dict[str, IFile] = {}
 
-    def check(v: object):
-        if isinstance(v, IFile):
-            f = v
-        elif isinstance(v, IRule):
-            f = next(iter(v.files.values()))
-        else:
-            f = None
+def _resolve_self(
+    files: Mapping[str, IFile], file_list: Sequence[IFile], o: SelfRule
+) -> IFile:
+    key = o.key
 
-        if f is not None:
-            absp = os.path.abspath(f)
-            if absp not in ypaths:
-                res[absp] = f
+    if key is None:
+        if len(file_list) >= 2:
+            raise TypeError(
+                "Self-without-key is not allowed when the "
+                "rule has multiple output files"
+            )
+
+        return file_list[0]
+    elif isinstance(key, int):
+        if key >= len(file_list):
+            raise IndexError(
+                f"SELF index is {key} but the rule "
+                f"has only {len(file_list)} output files"
+            )
+        return file_list[key]
+    else:
+        if key not in files:
+            raise KeyError(f"Failed to resolve SELF: {key}")
+        return files[key]
+
+
+def _accepts_any_args(sig: inspect.Signature) -> bool:
+    # Whether sig.bind(*args, **kwargs) succeeds for any args and kwargs,
+    # i.e. sig has both *args and **kwargs and its other parameters are
+    # positional-only or keyword-only ones with defaults
+    has_var_positional = has_var_keyword = False
+    for p in sig.parameters.values():
+        if p.kind == p.VAR_POSITIONAL:
+            has_var_positional = True
+        elif p.kind == p.VAR_KEYWORD:
+            has_var_keyword = True
+        elif p.kind == p.POSITIONAL_OR_KEYWORD or p.default is p.empty:
+            return False
+
+    return has_var_positional and has_var_keyword
+
+
+def _inspect_signature(
+    func: Callable[..., object]
+) -> Tuple[inspect.Signature, bool]:
+    sig = inspect.signature(func)
+    return sig, _accepts_any_args(sig)
+
+
+# Rules often share methods, for which inspect.signature is costly.
+# Function => signature info of the function, and of the bound methods of
+# the function (without the first parameter), respectively. Weakly keyed
+# not to keep user functions (and their closures) alive
+_function_signature_cache: weakref.WeakKeyDictionary[
+    Callable[..., object], Tuple[inspect.Signature, bool]
+] = weakref.WeakKeyDictionary()
+_method_signature_cache: weakref.WeakKeyDictionary[
+    Callable[..., object], Tuple[inspect.Signature, bool]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_signature_info(
+    func: Callable[..., object]
+) -> Tuple[inspect.Signature, bool]:
+    """
+    Returns:
+        tuple (signature of func, whether it accepts any arguments)
+    """
+    if type(func) is types.FunctionType:
+        cache, key = _function_signature_cache, func
+    elif type(func) is types.MethodType and (
+        type(func.__func__) is types.FunctionType
+    ):
+        # Keyed by the function not to keep __self__ alive
+        cache, key = _method_signature_cache, func.__func__
+    else:
+        # e.g. partials and callable objects. Not cached as they may hold
+        # arbitrary objects
+        return _inspect_signature(func)
 
-    map_structure(check, args)
+    info = cache.get(key)
+    if info is None:
+        info = cache[key] = _inspect_signature(func)
 
-    return res
+    return info
+
+
+def _get_signature(func: Callable[..., object]) -> inspect.Signature:
+    return _get_signature_info(func)[0]
 
 
 def _assert_signature_match(
@@ -938,7 +1147,9 @@ def _assert_signature_match(
     kwargs: Dict[str, object],
 ):
     try:
-        inspect.signature(func).bind(*args, **kwargs)
+        sig, accepts_any = _get_signature_info(func)
+        if not accepts_any:
+            sig.bind(*args, **kwargs)
     except Exception as e:
         raise TypeError(
             "Signature of the method does not match the arguments"
@@ -948,8 +1159,16 @@ def _assert_signature_match(
 NAME_REF_RULE = "<R>"
 NAME_REF_FILE = "<F>"
 
+_NAME_REF_PATTERN = re.compile(
+    f"{re.escape(NAME_REF_RULE)}|{re.escape(NAME_REF_FILE)}"
+)
+
 
 def _repl_name_ref(src: str, rule_name: str, file_key: Optional[str]) -> str:
+    # Both of the references start with "<"
+    if "<" not in src:
+        return src
+
     def _repl(m: re.Match[str]) -> str:
         r = m.group(0)
         if r == NAME_REF_RULE:
@@ -963,7 +1182,4 @@ def _repl_name_ref(src: str, rule_name: str, file_key: Optional[str]) -> str:
 
             return file_key
 
-    pattern = f"{re.escape(NAME_REF_RULE)}|{re.escape(NAME_REF_FILE)}"
-
-    a = re.sub(pattern, _repl, src)
-    return a
+    return _NAME_REF_PATTERN.sub(_repl, src)
@@ -98,6 +98,9 @@ def gen_dot_code(
 ):
     info = get_group_info_of_nodes(target_nodes)
 
+    # Resolve the default once rather than calling getcwd per path
+    basedir_ = basedir or os.getcwd()
+
     res: list[tuple[int, str]] = []
 
     res.append((0, "digraph {"))
@@ -120,6 +123,16 @@ def gen_dot_code(
         set(itertools.chain(gid.values(), rid.values())) - explicit_nodes
     )
 
+    # Abspaths of the output files of each rule
+    rule_ypaths: dict[IRule, list[str]] = {}
+
+    def get_ypaths(r: IRule) -> list[str]:
+        ypaths = rule_ypaths.get(r)
+        if ypaths is None:
+            ypaths = [os.path.abspath(f) for f in r.files.values()]
+            rule_ypaths[r] = ypaths
+        return ypaths
+
     def gen_group(g: IGroup, idt: int):
         if g not in gid:
             return
@@ -127,11 +140,11 @@ def gen_dot_code(
         name = "<ROOT>" if len(g.name_tuple) == 0 else g.name_tuple[-1]
 
         if g is info.root or g.parent.prefix == "":
-            prefix = _relpath(g.prefix, basedir)
+            prefix = _relpath(g.prefix, basedir_)
         elif g.prefix[: len(g.parent.prefix)] == g.parent.prefix:
             prefix = "... " + g.prefix[len(g.parent.prefix) :]
         else:
-            prefix = _relpath(g.prefix, basedir)
+            prefix = _relpath(g.prefix, basedir_)
 
         res.append((idt, f"subgraph {gid[g]} {{"))
         res.append(
@@ -149,12 +162,15 @@ def gen_dot_code(
         for child_group in g.groups.values():
             gen_group(child_group, idt + 1)
 
+        # Shared by the child rules
+        par_prefix = os.path.abspath(g.prefix + "_")[:-1]
+
         for name, child_rule in g.rules.items():
-            gen_rule(child_rule, idt + 1)
+            gen_rule(child_rule, par_prefix, idt + 1)
 
         res.append((idt, "};"))
 
-    def gen_rule(r: IRule, idt: int):
+    def gen_rule(r: IRule, par_prefix: str, idt: int):
         if r not in rid:
             return
 
@@ -165,10 +181,8 @@ def gen_dot_code(
         res.append((idt + 1, 'bgcolor = "#faedcd";'))
         res.append((idt + 1, 'color = "#d4a373";'))
 
-        par_prefix = os.path.abspath(r.parent.prefix + "_")[:-1]
-
-        for yf in r.files.values():
-            gen_file(os.path.abspath(yf), par_prefix, idt + 1)
+        for yf in get_ypaths(r):
+            gen_file(yf, par_prefix, idt + 1)
 
         res.append((idt, "}"))
 
@@ -176,10 +190,12 @@ def gen_dot_code(
         if f not in fid:
             return
 
+        rel = _relpath(f, basedir_)
+
         if par_prefix != "" and f[: len(par_prefix)] == par_prefix:
             p = "... " + f[len(par_prefix) :]
         else:
-            p = _relpath(f, basedir)
+            p = rel
 
         if os.path.exists(f):
             rule_id = info.rule_store.ypath2idx[f]
@@ -200,7 +216,7 @@ def gen_dot_code(
                 f"shape=box; "
                 f'fillcolor="#{color}"; '
                 'color = "#d4a373";'
-                f'URL="{_relpath(f, basedir)}"; '
+                f'URL="{rel}"; '
                 f"];",
             )
         )
@@ -214,7 +230,7 @@ def gen_dot_code(
 
     # define arrows
     for r in rid.keys():
-        f0 = os.path.abspath(next(iter(r.files.values())))
+        f0 = get_ypaths(r)[0]
         for xf in r.xfiles:
             xf = os.path.abspath(xf)
             if xf in fid:
@@ -1,4 +1,4 @@
-from typing import Iterator, Mapping, TypeVar
+from typing import ItemsView, Iterator, KeysView, Mapping, TypeVar, ValuesView
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -20,5 +20,16 @@ class DictView(Mapping[K, V]):
     def __contains__(self, key: object) -> bool:
         return key in self._dic
 
+    # Delegate to the underlying mapping. Mapping's mixin implementations
+    # go through __getitem__ per item, which dominates tree traversals
+    def keys(self) -> KeysView[K]:
+        return self._dic.keys()
+
+    def values(self) -> ValuesView[V]:
+        return self._dic.values()
+
+    def items(self) -> ItemsView[K, V]:
+        return self._dic.items()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}{dict(self)}"
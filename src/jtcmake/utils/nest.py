@@ -1,4 +1,13 @@
-from typing import Any, Callable, Iterable, Mapping, Sequence, Set, Type
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Mapping,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 T_Seq_Factory = Mapping[
     Type[Sequence[Any]], Callable[[Iterable[Any]], Sequence[Any]]
@@ -18,16 +27,25 @@ def map_structure(
 ):
     assert callable(map_fn)
 
+    seq_items = tuple(seq_factory.items())
+    map_items = tuple(map_factory.items())
+    set_items = tuple(set_factory.items())
+    container_types = _container_types(seq_factory, map_factory, set_factory)
+
     def rec(nest: Any):
-        for src, dst in seq_factory.items():
+        # Leaves are the majority. Filter them out by a single isinstance
+        if not isinstance(nest, container_types):
+            return map_fn(nest)
+
+        for src, dst in seq_items:
             if isinstance(nest, src):
                 return dst(map(rec, nest))
 
-        for src, dst in map_factory.items():
+        for src, dst in map_items:
             if isinstance(nest, src):
                 return dst({k: rec(v) for k, v in nest.items()})
 
-        for src, dst in set_factory.items():
+        for src, dst in set_items:
             if isinstance(nest, src):
                 return dst(map(rec, nest))
 
@@ -43,7 +61,12 @@ def ordered_map_structure(
     map_factory: T_Map_Factory = {dict: dict},
     set_factory: T_Set_Factory = {set: set},
 ):
+    container_types = _container_types(seq_factory, map_factory, set_factory)
+
     def rec(nest: object):
+        if not isinstance(nest, container_types):
+            return map_fn(nest)
+
         for src, dst in seq_factory.items():
             if isinstance(nest, src):
                 return dst(map(rec, nest))
@@ -61,3 +84,11 @@ def ordered_map_structure(
         return map_fn(nest)
 
     return rec(nest)
+
+
+def _container_types(
+    seq_factory: T_Seq_Factory,
+    map_factory: T_Map_Factory,
+    set_factory: T_Set_Factory,
+) -> Tuple[type, ...]:
+    return (*seq_factory, *map_factory, *set_factory)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import gc
 import os
+import weakref
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 import pytest
 
@@ -10,6 +12,7 @@ from jtcmake import SELF
 from jtcmake import GroupsGroup as GGroup
 from jtcmake import RulesGroup as RGroup
 from jtcmake import StaticGroupBase
+from jtcmake.group_tree import groups
 from jtcmake.group_tree.core import IGroup
 
 
@@ -56,6 +59,33 @@ def test_add_group_union():
     assert isinstance(g["b"], Group2)
 
 
+def test_add_group_default_type_not_reparsed(mocker: Any):
+    g: GGroup[Group1] = GGroup().set_default_child(Group1)
+
+    spy = mocker.spy(groups, "_parse_child_group_type")
+
+    assert isinstance(g.add_group("a", Group1), Group1)
+    assert isinstance(g.add_group("b"), Group1)
+    assert isinstance(g.add_group("c", Group2), Group2)  # pyright: ignore
+
+    assert spy.call_count == 1
+
+
+def test_child_group_type_collectable():
+    def use() -> weakref.ref[type]:
+        class Group3(RGroup):
+            ...
+
+        g: GGroup[Group3] = GGroup().set_default_child(Group3)
+        g.add_group("a")
+        g.add_group("b", Group3)
+        return weakref.ref(Group3)
+
+    ref = use()
+    gc.collect()
+    assert ref() is None
+
+
 def test_add_group_err_no_child():
     g: GGroup[Group1] = GGroup()
 
@@ -83,3 +113,19 @@ def test_err_abstract_child():
 
     with pytest.raises(TypeError):
         g.add_group("a", IGroup)
+
+
+def test_children_views():
+    g: GGroup[RGroup] = GGroup()
+    g.set_default_child(RGroup)
+
+    groups = g.groups
+    assert g.groups is groups
+    assert len(groups) == 0
+
+    # Views reflect children added later
+    sub = g.add_group("a")
+    assert groups == {"a": sub}
+
+    assert len(g.rules) == 0
+    assert len(sub.groups) == 0
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import gc
 import shutil
+import weakref
 from pathlib import Path
-from typing import Literal, Union
+from typing import Any, Literal, Union
+
+import pytest
 
 from jtcmake import SELF, GroupsGroup, Rule, StaticGroupBase
+from jtcmake.group_tree import groups
 
 
 def write(dst: Path, c: str):
@@ -106,3 +111,63 @@ def test_StaticGroup_make(tmp_path: Path):
     assert_content(g.r2[0], "a")
     assert_content(g.g1.sub1.r1[0], "a")
     assert_content(g.g1.sub2.r1[0], "b")
+
+
+def test_type_hints_resolved_once_per_class(mocker: Any):
+    spy = mocker.spy(groups, "get_type_hints")
+
+    class Static3(StaticGroupBase):
+        r1: Rule[str]
+
+    # Resolvable at the class definition
+    assert spy.call_count == 1
+
+    g1 = Static3()
+    g2 = Static3()
+
+    assert spy.call_count == 1
+    assert g1.r1 is not g2.r1
+    assert g1.rules == {"r1": g1.r1}
+
+
+def test_type_hints_resolution_error():
+    class Static4(StaticGroupBase):
+        r1: Rule[str]
+        g1: UndefinedGroup  # type: ignore # noqa: F821
+
+    # Failures are not cached
+    for _ in range(2):
+        with pytest.raises(Exception):
+            Static4()
+
+
+def test_child_plan_not_inherited():
+    class Static5(StaticGroupBase):
+        r1: Rule[str]
+
+    class Static6(Static5):
+        # Not resolvable at the class definition
+        g1: Static7  # pyright: ignore
+
+    class Static7(StaticGroupBase):
+        r1: Rule[str]
+
+    Static6.__globals__ = {"Static7": Static7}
+
+    g = Static6()
+    assert set(g.rules) == {"r1"}
+    assert set(g.groups) == {"g1"}
+    assert set(Static5().groups) == set()
+
+
+def test_static_group_class_collectable():
+    def define() -> weakref.ref[type]:
+        class Static8(StaticGroupBase):
+            r1: Rule[str]
+
+        Static8()
+        return weakref.ref(Static8)
+
+    ref = define()
+    gc.collect()
+    assert ref() is None
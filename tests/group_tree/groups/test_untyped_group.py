@@ -18,3 +18,28 @@ def test_basic(tmp_path: Path):
 
     assert g.a[0].read_text() == "a"
     assert g.sub.b[0].read_text() == "b"
+
+
+def test_name():
+    g = UntypedGroup()
+    g.add_group("a").add_group("b")
+
+    assert g.name == "/"
+    assert g.a.name == "/a"
+    assert g.a.b.name == "/a/b"
+
+
+def test_child_attribute():
+    g = UntypedGroup()
+    g.add_group("a")
+    g.add_group("make")
+    g.add("r", write)(SELF, "r")
+    g.add("clean", write)(SELF, "clean")
+
+    assert g.a is g["a"]
+    assert g.r is g["r"]
+
+    # Children must not shadow the methods
+    assert callable(g.make)
+    assert callable(g.clean)
+    assert isinstance(g["make"], UntypedGroup)
@@ -7,6 +7,7 @@ import pytest
 from jtcmake.group_tree import groups
 from jtcmake.group_tree.groups import GroupsGroup as GGroup
 from jtcmake.group_tree.groups import UntypedGroup
+from jtcmake.group_tree.rule import Rule
 
 T = TypeVar("T")
 
@@ -38,6 +39,8 @@ def test_get_type(type_hint: object, expect: object):
         (1, None),
         (groups.IGroup, None),
         (Union[UntypedGroup, GGroup[UntypedGroup]], None),
+        (Rule, None),
+        ([UntypedGroup], None),  # unhashable
     ],
 )
 def test_parse_child_group_type(child_group_type: object, expect: object):
@@ -48,3 +51,24 @@ def test_parse_child_group_type(child_group_type: object, expect: object):
             f(child_group_type)
     else:
         assert f(child_group_type) == expect
+
+
+@pytest.mark.parametrize(
+    "type_hint,expect_kind,expect_tp",
+    [
+        (Rule, "_CHILD_RULE", None),
+        (Rule[str], "_CHILD_RULE", None),
+        (UntypedGroup, "_CHILD_GROUP", UntypedGroup),
+        (GGroup[UntypedGroup], "_CHILD_GROUP", GGroup),
+        (groups.IGroup, "_CHILD_NONE", None),
+        (int, "_CHILD_NONE", None),
+        (Union[int, str], "_CHILD_NONE", None),
+    ],
+)
+def test_classify_child_type_hint(
+    type_hint: object, expect_kind: str, expect_tp: object
+):
+    f = groups._classify_child_type_hint  # pyright: ignore [reportPrivateUsage]
+    expect = (getattr(groups, expect_kind), expect_tp)
+
+    assert f(type_hint) == expect
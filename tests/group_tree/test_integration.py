@@ -2,7 +2,14 @@ from pathlib import Path
 
 import pytest
 
-from jtcmake import SELF, Rule, StaticGroupBase, UntypedGroup
+from jtcmake import (
+    SELF,
+    GroupsGroup,
+    Rule,
+    RulesGroup,
+    StaticGroupBase,
+    UntypedGroup,
+)
 
 
 class Group(StaticGroupBase):
@@ -32,6 +39,12 @@ def test_error_on_dupe_registration():
     with pytest.raises(KeyError):
         g.add("a", Path.write_text)(SELF, "a")
 
+    # rule -> rule
+    for g in (UntypedGroup(), RulesGroup()):
+        g.add("a", Path.write_text)(SELF, "a")
+        with pytest.raises(KeyError):
+            g.add("a", Path.write_text)(SELF, "a")
+
 
 def test_noskip(tmp_path: Path):
     g = UntypedGroup(tmp_path)
@@ -69,3 +82,14 @@ def test_file_dir_collision():
 
     g = UntypedGroup()
     g.add("a", fn)(SELF)
+
+
+def test_missing_child_attribute():
+    for g in (UntypedGroup(), GroupsGroup(), RulesGroup()):
+        assert not hasattr(g, "a")
+
+        with pytest.raises(AttributeError):
+            g.a
+
+        with pytest.raises(KeyError):
+            g["a"]
@@ -1,10 +1,13 @@
 # type: ignore
 from __future__ import annotations
 
+import functools
+import gc
 import hashlib
+import inspect
 import os
 import sys
-from collections.abc import Collection, Container, Iterator
+import weakref
 from pathlib import Path, PosixPath, WindowsPath
 
 import pytest
@@ -12,7 +15,7 @@ import pytest
 from jtcmake.group_tree import rule
 from jtcmake.group_tree.atom import Atom
 from jtcmake.group_tree.core import IFile
-from jtcmake.group_tree.groups import UntypedGroup
+from jtcmake.group_tree.groups import StaticGroupBase, UntypedGroup
 
 if sys.platform == "win32":
     _Path = WindowsPath
@@ -52,32 +55,6 @@ class DummyFile2(_Path, IFile):
         return False
 
 
-class DummyCollection(Collection):
-    """Fake object to represent a Collection object"""
-
-    def __init__(self, c: Collection) -> None:
-        self.c = c
-
-    def __contains__(self, __x: object) -> bool:
-        return __x in self.c
-
-    def __iter__(self) -> Iterator[object]:
-        return iter(self.c)
-
-    def __len__(self) -> int:
-        return len(self.c)
-
-
-class DummyContainer(Container):
-    """Fake object to represent a Container object"""
-
-    def __init__(self, c: Container) -> None:
-        self.c = c
-
-    def __contains__(self, __x: object) -> bool:
-        return __x in self.c
-
-
 absp = os.path.abspath
 
 
@@ -99,46 +76,157 @@ def test_assert_signature_match(func, args, kwargs, ok):
             rule._assert_signature_match(func, args, kwargs)
 
 
+@pytest.mark.parametrize(
+    "p", ["a", "a/../b/./c", "/x/y", absp("z"), Path("d/e"), DummyFile("f")]
+)
+def test_abspath(p):
+    assert rule._abspath(p, os.getcwd()) == os.path.abspath(p)
+
+
+@pytest.mark.parametrize(
+    "p,pfx",
+    [
+        ("a", ""),
+        ("a", "out/"),
+        ("./a//b/", "out/"),
+        ("../a", "out/"),
+        ("a", "../" + os.path.basename(os.getcwd()) + "/"),
+        (absp("a/./b"), "out/"),
+        ("/x/../y", ""),
+    ],
+)
+def test_normalize_path(p, pfx):
+    # Reference implementation
+    p_ = rule.concat_prefix(p, pfx)
+    rel = os.path.relpath(p_, os.getcwd())
+    expect = rel if len(rel) < len(p_) else p_
+
+    assert rule._normalize_path(p, pfx, os.getcwd()) == expect
+
+
+def test_get_signature():
+    def f(a, b=1):
+        ...
+
+    assert rule._get_signature(f) is rule._get_signature(f)
+
+    class Unhashable:
+        __hash__ = None
+
+        def __call__(self, x):
+            ...
+
+    assert list(rule._get_signature(Unhashable()).parameters) == ["x"]
+
+    class A:
+        def m(self, x):
+            ...
+
+    a = A()
+    assert rule._get_signature(a.m) is rule._get_signature(a.m)
+    assert list(rule._get_signature(a.m).parameters) == ["x"]
+    assert list(rule._get_signature(A.m).parameters) == ["self", "x"]
+
+
+def test_signature_cache_does_not_keep_callables():
+    class A:
+        def m(self, x):
+            ...
+
+    def make_func():
+        buf = bytearray(16)
+
+        def f(x):
+            return buf
+
+        return f
+
+    f, a = make_func(), A()
+    refs = [weakref.ref(f), weakref.ref(a)]
+
+    g = UntypedGroup()
+    g.add("f", f)(rule.SELF)
+    g.add("m", a.m)(rule.SELF)
+    g.add("p", functools.partial(f))(rule.SELF)
+
+    del f, a, g
+    gc.collect()
+    assert all(r() is None for r in refs)
+
+
+def _f1(*args, **kwargs):
+    ...
+
+
+def _f2(a=1, /, *args, b, **kwargs):
+    ...
+
+
+def _f3(a=1, /, *args, b=2, **kwargs):
+    ...
+
+
+def _f4(a=1, *args, **kwargs):
+    ...
+
+
+def _f5(*args):
+    ...
+
+
+@pytest.mark.parametrize(
+    "func,expect",
+    [(_f1, True), (_f2, False), (_f3, True), (_f4, False), (_f5, False)],
+)
+def test_accepts_any_args(func, expect):
+    sig = inspect.signature(func)
+    assert rule._accepts_any_args(sig) == expect
+
+    if expect:
+        for args, kwargs in [((), {}), ((1, 2), {"a": 1, "b": 2, "c": 3})]:
+            sig.bind(*args, **kwargs)
+
+
 @pytest.mark.parametrize(
     "ypaths,args,expect",
     [
         (
-            DummyContainer([absp("a"), absp("b")]),
+            {absp("a"): DummyFile("a")},
             {1: [(DummyFile("a"), DummyFile("x"))]},
             {absp("x"): DummyFile("x")},
         ),
         (
-            DummyContainer([absp("a"), absp("b")]),
+            {absp("a"): DummyFile("a")},
             {1: [(DummyFile("a"), Path("x"))]},
             {},
         ),
     ],
 )
-def test_find_xfiles_in_args(ypaths, args, expect):
-    assert rule._find_xfiles_in_args(ypaths, args) == expect
+def test_resolve_args_xfiles(ypaths, args, expect):
+    assert rule._resolve_args({}, {}, ypaths, args, os.getcwd())[2] == expect
 
 
 @pytest.mark.parametrize(
     "ypaths,args,ok",
     [
         (
-            DummyCollection({absp("a"), absp("b")}),
+            {absp("a"): DummyFile("a"), absp("b"): DummyFile("b")},
             [DummyFile("a"), {1: DummyFile("b")}],
             True,
         ),
         (
-            DummyCollection({absp("a"), absp("b")}),
+            {absp("a"): DummyFile("a"), absp("b"): DummyFile("b")},
             [DummyFile("a"), {1: Path("b")}],
             False,
         ),
     ],
 )
-def test_assert_all_yfiles_used_in_args(ypaths, args, ok):
+def test_resolve_args_all_yfiles_used(ypaths, args, ok):
     if ok:
-        rule._assert_all_yfiles_used_in_args(ypaths, args)
+        rule._resolve_args({}, {}, ypaths, args, os.getcwd())
     else:
         with pytest.raises(ValueError):
-            rule._assert_all_yfiles_used_in_args(ypaths, args)
+            rule._resolve_args({}, {}, ypaths, args, os.getcwd())
 
 
 @pytest.mark.parametrize(
@@ -149,31 +237,74 @@ def test_assert_all_yfiles_used_in_args(ypaths, args, ok):
         ({"x": DummyFile("a")}, [(1, rule.SELF)], [(1, DummyFile("a"))]),
         (
             {"x": DummyFile("a"), "y": DummyFile("b")},
-            [(1, rule.SELF[1])],
-            [(1, DummyFile("b"))],
+            [(rule.SELF[1], rule.SELF[0])],
+            [(DummyFile("b"), DummyFile("a"))],
         ),
         (
             {"x": DummyFile("a"), "y": DummyFile("b")},
             [(1, rule.SELF)],
             Exception(),
         ),
+        ({"x": DummyFile("a")}, [rule.SELF[1]], IndexError()),
+        ({"x": DummyFile("a")}, [rule.SELF.y], KeyError()),
     ],
 )
-def test_replace_self(files, args, expect):
+def test_resolve_args_self(files, args, expect):
+    ypaths = {absp(f): f for f in files.values()}
+
     if isinstance(expect, Exception):
         with pytest.raises(type(expect)):
-            rule._replace_self(files, args)
+            rule._resolve_args({}, files, ypaths, args, os.getcwd())
     else:
-        assert rule._replace_self(files, args) == expect
-
-
-def test_replace_obj_by_atom_in_structure():
+        cwd = os.getcwd()
+        res, real, xp2f = rule._resolve_args({}, files, ypaths, args, cwd)
+        assert res == expect
+        assert real == [
+            tuple(Path(v) if isinstance(v, IFile) else v for v in t)
+            for t in expect
+        ]
+        assert all(type(v) is not DummyFile for t in real for v in t)
+        assert xp2f == {}
+
+
+def test_resolve_args_atoms():
     objs = [0, {}]
     atoms = [Atom(o, None) for o in objs]
     store = {id(o): a for o, a in zip(objs, atoms)}
-    args = [{"a": (*objs, 1)}]
-    expect = [{"a": (*atoms, 1)}]
-    assert rule._replace_obj_by_atom_in_structure(store, args) == expect
+    args = [{"a": (*objs, 1)}, {2, 3}]
+    expect = [{"a": (*atoms, 1)}, {2, 3}]
+    res, real, _ = rule._resolve_args(store, {}, {}, args, os.getcwd())
+    assert res == expect
+    assert real == args
+
+
+def test_resolve_args_does_not_keep_arg_types():
+    def use() -> weakref.ref[type]:
+        class A:
+            ...
+
+        rule._resolve_args({}, {}, {}, [A()], os.getcwd())
+        return weakref.ref(A)
+
+    ref = use()
+    gc.collect()
+    assert ref() is None
+
+
+def test_resolve_args_container_subclass():
+    class D(dict):  # pyright: ignore
+        ...
+
+    class L(list):  # pyright: ignore
+        ...
+
+    x = object()
+    atom = Atom(x, None)
+    args = (D(a=L([x])), L([1]))
+    res, real, _ = rule._resolve_args({id(x): atom}, {}, {}, args, os.getcwd())
+    assert res == ({"a": [atom]}, [1])
+    assert real == ({"a": [x]}, [1])
+    assert type(res[0]) is dict and type(res[0]["a"]) is list
 
 
 @pytest.mark.parametrize(
@@ -199,6 +330,10 @@ def test_replace_obj_by_atom_in_structure():
             ["a<R>", Path_("b<R>")],
             {"ar": DummyFile("ar"), "br": DummyFile("br")},
         ),
+        (
+            {"a": "<a>", "b": "<R><r>"},
+            {"a": DummyFile("<a>"), "b": DummyFile("r<r>")},
+        ),
         (
             ["<F>"],
             ValueError(),
@@ -207,6 +342,10 @@ def test_replace_obj_by_atom_in_structure():
             "<F>",
             ValueError(),
         ),
+        (
+            {"a": "a", 1: "b"},
+            TypeError(),
+        ),
     ],
 )
 def test_parse_args_output_files(ofiles, expect):
@@ -228,6 +367,22 @@ def test_parse_args_output_files(ofiles, expect):
         rule.parse_args_output_files([*keys, "x"], ofiles, DummyFile)
 
 
+@pytest.mark.parametrize(
+    "ref,expect",
+    [
+        (None, True),
+        (["a", "b"], True),
+        (("a", "b"), True),
+        (["b", "a"], False),
+        (["a"], False),
+        (["a", "b", "c"], False),
+    ],
+)
+def test_check_file_keys(ref, expect):
+    files = {"a": DummyFile("a"), "b": DummyFile("b")}
+    assert rule._check_file_keys(files, ref) == expect
+
+
 @pytest.mark.parametrize(
     "method,expect",
     [
@@ -259,3 +414,66 @@ def test_memo_file(tmp_path: Path):
     assert os.path.abspath(r.memo_file) == os.path.abspath(
         tmp_path / f"{basename}.json"
     )
+
+
+def test_uninitialized():
+    class _Group(StaticGroupBase):
+        a: rule.Rule[str]
+
+    def _f(_: Path):
+        ...
+
+    g = _Group()
+    assert not g.a.initialized
+
+    for name in ("files", "xfiles", "raw_rule_id"):
+        with pytest.raises(Exception, match=name):
+            getattr(g.a, name)
+
+    g.a.init(_f)(rule.SELF)
+    assert g.a.initialized
+    assert list(g.a.files) == ["a"]
+
+
+def test_getitem():
+    def _f(a: Path, b: Path):
+        ...
+
+    g = UntypedGroup()
+    r = g.add("r", {"x": "a", "y": "b"}, _f)(rule.SELF[0], rule.SELF[1])
+
+    assert r[0] is r["x"] is r.x
+    assert r[1] is r[-1] is r["y"]
+
+    with pytest.raises(IndexError):
+        r[2]
+
+
+def test_file_key_attributes():
+    def _f(a: Path, b: Path):
+        ...
+
+    g = UntypedGroup()
+    r = g.add("r", {"x": "a", "name": "b"}, _f)(rule.SELF[0], rule.SELF[1])
+
+    assert r.x is r["x"]
+    assert r.name == "/r"  # file keys do not shadow the members
+    assert not hasattr(r, "y")
+    assert not hasattr(r, "__dict__")
+
+
+def test_touch(tmp_path: Path):
+    def _f(a: Path, b: Path):
+        ...
+
+    g = UntypedGroup(tmp_path)
+    r = g.add("r", ["a", "b"], _f)(rule.SELF[0], rule.SELF[1])
+    (tmp_path / "a").touch()
+
+    r.touch(memo=False, create=False, t=1)
+    assert os.path.getmtime(tmp_path / "a") == 1
+    assert not (tmp_path / "b").exists()
+
+    r.touch(memo=False, t=2)
+    assert os.path.getmtime(tmp_path / "a") == 2
+    assert os.path.getmtime(tmp_path / "b") == 2
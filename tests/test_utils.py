@@ -2,6 +2,7 @@
 
 import pytest
 
+from jtcmake.utils.dict_view import DictView
 from jtcmake.utils.nest import map_structure
 
 
@@ -21,3 +22,18 @@ def add1(x):
 def test_map_structure(x, x2):
     assert map_structure(lambda x: x, x) == x
     assert map_structure(lambda x: 2 * x, x) == x2
+
+
+def test_dict_view():
+    d = {"a": 1, "b": 2}
+    v = DictView(d)
+
+    assert list(v.keys()) == ["a", "b"]
+    assert list(v.values()) == [1, 2]
+    assert list(v.items()) == [("a", 1), ("b", 2)]
+    assert v.get("a") == 1 and v.get("c") is None
+    assert "a" in v and len(v) == 2
+    assert v == d
+
+    d["c"] = 3
+    assert list(v.values()) == [1, 2, 3]